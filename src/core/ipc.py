@@ -3,11 +3,17 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from typing import Any, Dict, Optional
 
 import zmq
 import zmq.asyncio
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 
 # Topics (always bytes for consistency)
 TOPIC_WW_DETECTED = b"ww.detected"
@@ -46,11 +52,23 @@ def _ctx(async_mode: bool = False) -> zmq.Context:
     return zmq.Context.instance()
 
 
-def _ipc_addrs(config: Dict[str, Any]) -> tuple[str, str]:
+# channel -> (env override, default endpoint). The frames_* pair carries the
+# high-rate TOPIC_VISN_FRAME stream through start_frame_proxy() so JPEG frames
+# never pass through the orchestrator's event loop.
+_CHANNELS: Dict[str, tuple[str, str]] = {
+    "upstream": ("IPC_UPSTREAM", "tcp://127.0.0.1:6010"),
+    "downstream": ("IPC_DOWNSTREAM", "tcp://127.0.0.1:6011"),
+    "frames_upstream": ("IPC_FRAMES_UPSTREAM", "tcp://127.0.0.1:6012"),
+    "frames_downstream": ("IPC_FRAMES_DOWNSTREAM", "tcp://127.0.0.1:6013"),
+}
+
+
+def _channel_addr(config: Dict[str, Any], channel: str) -> str:
+    if channel not in _CHANNELS:
+        channel = "downstream"
+    env_key, default = _CHANNELS[channel]
     ipc_cfg = config.get("ipc", {}) if config else {}
-    upstream = os.environ.get("IPC_UPSTREAM", ipc_cfg.get("upstream", "tcp://127.0.0.1:6010"))
-    downstream = os.environ.get("IPC_DOWNSTREAM", ipc_cfg.get("downstream", "tcp://127.0.0.1:6011"))
-    return upstream, downstream
+    return os.environ.get(env_key, ipc_cfg.get(channel, default))
 
 
 def make_publisher(
@@ -58,20 +76,24 @@ def make_publisher(
     *, 
     channel: str = "upstream", 
     bind: bool = False,
-    context: Optional[zmq.Context] = None
+    context: Optional[zmq.Context] = None,
+    sndhwm: Optional[int] = None
 ) -> zmq.Socket:
     """Create a PUB socket.
     
     Args:
         config: System configuration dict
-        channel: 'upstream' or 'downstream'
+        channel: 'upstream', 'downstream', 'frames_upstream' or 'frames_downstream'
         bind: If True, bind; otherwise connect
         context: Optional ZMQ context (for async usage)
+        sndhwm: Optional per-subscriber send high-water mark (libzmq default 1000)
     """
-    upstream, downstream = _ipc_addrs(config)
-    addr = upstream if channel == "upstream" else downstream
+    addr = _channel_addr(config, channel)
     ctx = context or _ctx()
     sock = ctx.socket(zmq.PUB)
+    if sndhwm is not None:
+        # Must be set before bind/connect to apply to every pipe.
+        sock.setsockopt(zmq.SNDHWM, sndhwm)
     (sock.bind if bind else sock.connect)(addr)
     return sock
 
@@ -89,12 +111,11 @@ def make_subscriber(
     Args:
         config: System configuration dict
         topic: Topic to subscribe to (empty = all)
-        channel: 'upstream' or 'downstream'
+        channel: 'upstream', 'downstream', 'frames_upstream' or 'frames_downstream'
         bind: If True, bind; otherwise connect
         context: Optional ZMQ context (for async usage)
     """
-    upstream, downstream = _ipc_addrs(config)
-    addr = upstream if channel == "upstream" else downstream
+    addr = _channel_addr(config, channel)
     ctx = context or _ctx()
     sock = ctx.socket(zmq.SUB)
     sock.setsockopt(zmq.SUBSCRIBE, topic)
@@ -102,6 +123,61 @@ def make_subscriber(
     return sock
 
 
+def start_frame_proxy(
+    config: Dict[str, Any],
+    *,
+    context: Optional[zmq.Context] = None
+) -> threading.Thread:
+    """Bind the frames_upstream/frames_downstream pair and forward between them.
+
+    ``zmq.proxy`` shuttles messages inside libzmq on a daemon thread, so camera
+    frames reach subscribers without being decoded or routed in Python.
+    Subscriptions flow back through the XPUB/XSUB pair, so publishers only send
+    frames while someone is subscribed.
+    """
+    ctx = context or _ctx()
+    frontend = ctx.socket(zmq.XSUB)
+    backend = ctx.socket(zmq.XPUB)
+    try:
+        frontend.bind(_channel_addr(config, "frames_upstream"))
+        backend.bind(_channel_addr(config, "frames_downstream"))
+    except zmq.ZMQError:
+        frontend.close(linger=0)
+        backend.close(linger=0)
+        raise
+
+    def _run() -> None:
+        try:
+            zmq.proxy(frontend, backend)
+        except zmq.ContextTerminated:
+            pass
+        finally:
+            frontend.close(linger=0)
+            backend.close(linger=0)
+
+    thread = threading.Thread(target=_run, name="FrameProxy", daemon=True)
+    thread.start()
+    return thread
+
+
+if orjson is not None:
+    def dumps_json(payload: Any) -> bytes:
+        """Serialize a payload to UTF-8 JSON bytes."""
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+    loads_json = orjson.loads
+else:
+    def dumps_json(payload: Any) -> bytes:
+        """Serialize a payload to UTF-8 JSON bytes."""
+        return json.dumps(payload).encode("utf-8")
+
+    loads_json = json.loads
+
+
 def publish_json(sock: zmq.Socket, topic: bytes, payload: Dict[str, Any]) -> None:
-    """Publish a JSON payload on a topic."""
-    sock.send_multipart([topic, json.dumps(payload).encode("utf-8")])
+    """Publish a JSON payload on a topic.
+
+    The encoded bytes are handed to libzmq without an extra copy; pyzmq still
+    copies payloads below its ``copy_threshold``, so small messages are unaffected.
+    """
+    sock.send_multipart((topic, dumps_json(payload)), copy=False, track=False)
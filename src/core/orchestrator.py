@@ -12,12 +12,15 @@ LED COLOR SCHEME (granular feedback):
 """
 from __future__ import annotations
 
-import json
-import random
+import itertools
+import logging
+import math
+import re
+import threading
 import time
-from enum import Enum, auto
+from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import zmq
 
@@ -42,24 +45,89 @@ from src.core.ipc import (
     TOPIC_TTS,
     TOPIC_VISN,
     TOPIC_VISN_CAPTURED,
-    TOPIC_VISN_FRAME,
     TOPIC_WW_DETECTED,
+    dumps_json,
+    loads_json,
     make_publisher,
     make_subscriber,
-    publish_json,
+    start_frame_proxy,
 )
 from src.core.logging_setup import get_logger
 from src.core.world_context import WorldContextAggregator
 
 logger = get_logger("orchestrator", Path("logs"))
 
+# Display texts published on every phase cycle; their payloads are pre-encoded.
+_STATIC_DISPLAY_TEXTS = (
+    "Idle",
+    "Listening...",
+    "Wakeword detected",
+    "Recovered. Ready.",
+    "Obstacle detected - stopping",
+)
+
 
-class Phase(Enum):
-    IDLE = auto()
-    LISTENING = auto()
-    THINKING = auto()
-    SPEAKING = auto()
-    ERROR = auto()
+# Spoken feedback for rejected STT results, keyed by failure reason.
+_STT_FEEDBACK: Dict[str, Tuple[str, ...]] = {
+    "timeout": (
+        "I didn't catch anything. Try again?",
+        "I lost you there. Say it once more.",
+        "I waited but heard nothing. Please try again.",
+    ),
+    "empty": (
+        "I couldn't make that out. Please speak clearly.",
+        "That came through empty. Try a bit louder.",
+        "I missed that. Please repeat.",
+    ),
+    "low_confidence": (
+        "I'm not sure I got that. Please repeat.",
+        "That was unclear. Say it again for me.",
+        "I didn't get enough confidence. Try again.",
+    ),
+}
+
+
+def _stamped_prefix(fields: Dict[str, Any]) -> bytes:
+    """Encode ``fields`` as a JSON object left open for a trailing timestamp."""
+    return dumps_json(fields)[:-1] + b',"timestamp":'
+
+
+# Command payloads with no variable fields, encoded once at import.
+_PAUSE_VISION_ON = dumps_json({"pause": True, "source": "orchestrator"})
+_PAUSE_VISION_OFF = dumps_json({"pause": False, "source": "orchestrator"})
+_LISTEN_START = dumps_json({"start": True, "source": "orchestrator"})
+_NAV_STOP_OBSTACLE = dumps_json({"direction": "stop", "reason": "obstacle", "source": "orchestrator"})
+_ESP_STOP_OBSTACLE = dumps_json({"direction": "stop", "reason": "obstacle"})
+_ESP_STOP_COLLISION = dumps_json({"direction": "stop", "reason": "collision"})
+_LISTEN_STOP = {
+    reason: dumps_json({"stop": True, "reason": reason, "source": "orchestrator"})
+    for reason in ("success", "empty", "low_confidence", "timeout")
+}
+
+
+class Phase(IntEnum):
+    IDLE = 0
+    LISTENING = 1
+    THINKING = 2
+    SPEAKING = 3
+    ERROR = 4
+
+
+class Event(IntEnum):
+    WAKEWORD = 0
+    AUTO_TRIGGER = 1
+    MANUAL_TRIGGER = 2
+    MANUAL_THINK = 3
+    MANUAL_TEXT = 4
+    STT_VALID = 5
+    STT_INVALID = 6
+    STT_TIMEOUT = 7
+    LLM_WITH_SPEECH = 8
+    LLM_NO_SPEECH = 9
+    TTS_DONE = 10
+    HEALTH_ERROR = 11
+    HEALTH_OK = 12
+    ERROR_TIMEOUT = 13
 
 
 class VisionMode(Enum):
@@ -68,47 +136,167 @@ class VisionMode(Enum):
     ON_WITH_STREAM = "on_with_stream"
 
 
+def _build_transition_table(
+    transitions: Dict[Tuple[Phase, Event], Phase],
+) -> Tuple[Tuple[Optional[Phase], ...], ...]:
+    """Flatten a transition map into a [phase][event] jump table."""
+    table: list[list[Optional[Phase]]] = [[None] * len(Event) for _ in Phase]
+    for (phase, event), next_phase in transitions.items():
+        table[phase][event] = next_phase
+    return tuple(tuple(row) for row in table)
+
+
 class Orchestrator:
+    # Long-lived singleton touched on every event: keep attribute access on slots.
+    __slots__ = (
+        "config",
+        "cmd_pub",
+        "_send",
+        "_outbox",
+        "events_sub",
+        "_frame_proxy",
+        "_handlers",
+        "_world_context",
+        "_phase",
+        "_phase_entered_ts",
+        "_last_interaction_ts",
+        "_last_transcript",
+        "_last_vision",
+        "_last_nav_direction",
+        "_vision_capture_pending",
+        "_esp_obstacle",
+        "_esp_min_distance",
+        "_obstacle_latched",
+        "_remote_session_active",
+        "_remote_last_seen",
+        "_phase_deadline",
+        "_vision_capture_deadline",
+        "_remote_session_deadline",
+        "_next_deadline",
+        "auto_trigger_enabled",
+        "auto_trigger_interval",
+        "stt_timeout_s",
+        "stt_min_confidence",
+        "error_recovery_s",
+        "remote_session_timeout_s",
+        "vision_mode",
+        "_stt_feedback_idx",
+        "_request_seq",
+        "_event_ts",
+        "_wake_ts",
+        "_led_prefixes",
+        "_text_prefixes",
+        "_last_led_prefix",
+    )
+
     TRANSITIONS = {
-        (Phase.IDLE, "wakeword"): Phase.LISTENING,
-        (Phase.IDLE, "auto_trigger"): Phase.LISTENING,
-        (Phase.IDLE, "manual_trigger"): Phase.LISTENING,
-        (Phase.IDLE, "manual_think"): Phase.THINKING,
-        (Phase.IDLE, "manual_text"): Phase.THINKING,
-        (Phase.LISTENING, "stt_valid"): Phase.THINKING,
-        (Phase.LISTENING, "stt_invalid"): Phase.IDLE,
-        (Phase.LISTENING, "stt_timeout"): Phase.IDLE,
-        (Phase.THINKING, "llm_with_speech"): Phase.SPEAKING,
-        (Phase.THINKING, "llm_no_speech"): Phase.IDLE,
-        (Phase.SPEAKING, "tts_done"): Phase.IDLE,
-        (Phase.IDLE, "health_error"): Phase.ERROR,
-        (Phase.LISTENING, "health_error"): Phase.ERROR,
-        (Phase.THINKING, "health_error"): Phase.ERROR,
-        (Phase.SPEAKING, "health_error"): Phase.ERROR,
-        (Phase.ERROR, "health_ok"): Phase.IDLE,
-        (Phase.ERROR, "error_timeout"): Phase.IDLE,
+        (Phase.IDLE, Event.WAKEWORD): Phase.LISTENING,
+        (Phase.IDLE, Event.AUTO_TRIGGER): Phase.LISTENING,
+        (Phase.IDLE, Event.MANUAL_TRIGGER): Phase.LISTENING,
+        (Phase.IDLE, Event.MANUAL_THINK): Phase.THINKING,
+        (Phase.IDLE, Event.MANUAL_TEXT): Phase.THINKING,
+        (Phase.LISTENING, Event.STT_VALID): Phase.THINKING,
+        (Phase.LISTENING, Event.STT_INVALID): Phase.IDLE,
+        (Phase.LISTENING, Event.STT_TIMEOUT): Phase.IDLE,
+        (Phase.THINKING, Event.LLM_WITH_SPEECH): Phase.SPEAKING,
+        (Phase.THINKING, Event.LLM_NO_SPEECH): Phase.IDLE,
+        (Phase.SPEAKING, Event.TTS_DONE): Phase.IDLE,
+        (Phase.IDLE, Event.HEALTH_ERROR): Phase.ERROR,
+        (Phase.LISTENING, Event.HEALTH_ERROR): Phase.ERROR,
+        (Phase.THINKING, Event.HEALTH_ERROR): Phase.ERROR,
+        (Phase.SPEAKING, Event.HEALTH_ERROR): Phase.ERROR,
+        (Phase.ERROR, Event.HEALTH_OK): Phase.IDLE,
+        (Phase.ERROR, Event.ERROR_TIMEOUT): Phase.IDLE,
+    }
+    _TRANS = _build_transition_table(TRANSITIONS)
+
+    VISION_CAPTURE_TIMEOUT_S = 3.0
+
+    # Poll cadence (ms) when nothing is due sooner; IDLE only waits on inbound events.
+    _POLL_TIMEOUT_MS = {Phase.IDLE: 1000, Phase.ERROR: 250}
+    _DEFAULT_POLL_TIMEOUT_MS = 100
+    # Messages handled per wake-up before the timeout checks get a turn.
+    _MAX_DRAIN = 64
+
+    _ALLOWED_DIRECTIONS = frozenset({"forward", "backward", "left", "right", "stop", "scan"})
+    # Pre-encoded orchestrator nav.command payload per normalized direction.
+    _NAV_PAYLOADS = {
+        direction: dumps_json({"direction": direction, "source": "orchestrator"})
+        for direction in _ALLOWED_DIRECTIONS
     }
 
+    # Remote intent routing tables used by on_remote_intent.
+    _INTENT_VISION_MODE = {
+        "enable_vision": VisionMode.ON_NO_STREAM,
+        "enable_perception": VisionMode.ON_NO_STREAM,
+        "disable_vision": VisionMode.OFF,
+        "disable_perception": VisionMode.OFF,
+        "enable_stream": VisionMode.ON_WITH_STREAM,
+        "disable_stream": VisionMode.ON_NO_STREAM,
+    }
+    # intent -> (nav direction, whether the accepted event reports the direction)
+    _INTENT_NAV = {
+        "scan": ("scan", False),
+        "start_scan": ("scan", False),
+        "stop": ("stop", False),
+        "stop_motion": ("stop", False),
+        "move_backward": ("backward", True),
+    }
+    # intent -> default direction when the payload does not carry one
+    _INTENT_MOTION = {
+        "rotate": "",
+        "rotate_left": "left",
+        "rotate_right": "right",
+        "start_motion": "forward",
+        "start": "forward",
+    }
+    _MOTION_DIRECTIONS = frozenset({"forward", "backward", "left", "right"})
+
+    # Transcript phrases that ask for a fresh camera capture before the LLM call.
+    # Matched against casefolded text, so the pattern itself is lowercase.
+    _VISION_RE = re.compile(r"what do you see|what are you seeing|describe|look at")
+
     def __init__(self) -> None:
         self.config = load_config(Path("config/system.yaml"))
-        self.cmd_pub = make_publisher(self.config, channel="downstream", bind=True)
-        self.events_sub = make_subscriber(self.config, channel="upstream", bind=True)
+        # Command bursts (collision + health + UI) must not hit the default HWM of 1000.
+        self.cmd_pub = make_publisher(self.config, channel="downstream", bind=True, sndhwm=10000)
+        self.cmd_pub.setsockopt(zmq.LINGER, 0)
+        # Bound once; outbound messages are staged in _outbox and sent by _flush.
+        self._send = self.cmd_pub.send_multipart
+        self._outbox: List[Tuple[bytes, bytes]] = []
+        # The other handler topics are subscribed once the table exists (end of __init__).
+        self.events_sub = make_subscriber(self.config, topic=TOPIC_ESP, channel="upstream", bind=True)
+        # Camera frames bypass the event loop on their own XSUB/XPUB pair. The
+        # relay is optional: a port clash must not keep the FSM from starting.
+        self._frame_proxy: Optional[threading.Thread] = None
+        try:
+            self._frame_proxy = start_frame_proxy(self.config)
+        except zmq.ZMQError as exc:
+            logger.error("Frame relay unavailable; continuing without it: %s", exc)
         self._world_context = WorldContextAggregator(self.config)
         self._world_context.start()
         self._phase = Phase.IDLE
-        self._phase_entered_ts = time.time()
-        self._last_interaction_ts = time.time()
+        # Interval bookkeeping uses the monotonic clock; time.time() is only
+        # used for epoch timestamps that are published to other services.
+        self._phase_entered_ts = time.monotonic()
+        self._last_interaction_ts = time.monotonic()
         self._last_transcript = ""
         self._last_vision: Optional[Dict[str, Any]] = None
         self._last_nav_direction = "stopped"
         self._vision_capture_pending: Optional[str] = None
-        self._vision_capture_requested_ts: Optional[float] = None
         self._esp_obstacle = False
         self._esp_min_distance = -1
         self._obstacle_latched = False
 
         self._remote_session_active = False
         self._remote_last_seen = 0.0
+
+        # Absolute deadlines (math.inf when unarmed); _next_deadline is their minimum
+        # so the run loop only does real timeout work once something is due.
+        self._phase_deadline = math.inf
+        self._vision_capture_deadline = math.inf
+        self._remote_session_deadline = math.inf
+        self._next_deadline = math.inf
         
         orch_cfg = self.config.get("orchestrator", {}) or {}
         self.auto_trigger_enabled = bool(orch_cfg.get("auto_trigger_enabled", True))
@@ -123,22 +311,69 @@ class Orchestrator:
         self.remote_session_timeout_s = float(remote_cfg.get("session_timeout_s", 15.0))
 
         vision_cfg = self.config.get("vision", {}) or {}
-        default_mode = str(vision_cfg.get("default_mode", "off")).lower()
-        self.vision_mode = self._coerce_vision_mode(default_mode)
+        self.vision_mode = self._coerce_vision_mode(str(vision_cfg.get("default_mode", "off")))
+
+        # Round-robin position per failure reason into _STT_FEEDBACK.
+        self._stt_feedback_idx: Dict[str, int] = dict.fromkeys(_STT_FEEDBACK, 0)
+        # Epoch seconds for outgoing payload timestamps, sampled once per loop wake-up.
+        self._event_ts = int(time.time())
+        # Monotonic counterpart of _event_ts: phase entries, interaction times and
+        # deadlines armed by handlers all use this one sample per wake-up.
+        self._wake_ts = time.monotonic()
+        # Capture request ids are "<prefix>-<epoch s>-<seq>": unique within a run
+        # even when two land in the same millisecond, and across restarts.
+        self._request_seq = itertools.count()
+
+        # Pre-encoded payload prefixes; only the timestamp is appended per publish.
+        self._led_prefixes: Dict[Tuple[str, str], bytes] = {}
+        self._text_prefixes: Dict[str, bytes] = {
+            text: _stamped_prefix({"text": text, "source": "orchestrator"})
+            for text in _STATIC_DISPLAY_TEXTS
+        }
+        # Last LED state sent; an identical repeat is not re-published. Display
+        # text is always sent: overlays expire, and safety captions must repeat.
+        self._last_led_prefix: Optional[bytes] = None
+
+        # Inbound JSON topic -> bound handler; unknown topics are ignored.
+        self._handlers = self._build_handlers()
+        # Let libzmq drop topics nobody handles (camera frames included).
+        for topic in self._handlers:
+            if topic != TOPIC_ESP:
+                self.events_sub.setsockopt(zmq.SUBSCRIBE, topic)
+
+    def _publish(self, topic: bytes, payload: Dict[str, Any]) -> None:
+        self._outbox.append((topic, dumps_json(payload)))
+
+    def _flush(self) -> None:
+        """Send everything staged since the last flush, in order, back to back."""
+        outbox = self._outbox
+        if not outbox:
+            return
+        send = self._send
+        for message in outbox:
+            send(message, copy=False, track=False)
+        outbox.clear()
 
     def _publish_led_state(self, state: str) -> None:
-        publish_json(self.cmd_pub, TOPIC_DISPLAY_STATE, {
-            "state": state,
-            "phase": self._phase.name,
-            "timestamp": int(time.time()),
-            "source": "orchestrator",
-        })
+        key = (state, self._phase.name)
+        prefix = self._led_prefixes.get(key)
+        if prefix is None:
+            prefix = _stamped_prefix({"state": state, "phase": key[1], "source": "orchestrator"})
+            self._led_prefixes[key] = prefix
+        if prefix is self._last_led_prefix:
+            return
+        self._last_led_prefix = prefix
+        self._outbox.append((TOPIC_DISPLAY_STATE, b"%s%d}" % (prefix, self._event_ts)))
         logger.debug("LED: %s", state)
 
     def _publish_display_text(self, text: str) -> None:
-        publish_json(self.cmd_pub, TOPIC_DISPLAY_TEXT, {
+        prefix = self._text_prefixes.get(text)
+        if prefix is not None:
+            self._outbox.append((TOPIC_DISPLAY_TEXT, b"%s%d}" % (prefix, self._event_ts)))
+            return
+        self._publish(TOPIC_DISPLAY_TEXT, {
             "text": text,
-            "timestamp": int(time.time()),
+            "timestamp": self._event_ts,
             "source": "orchestrator",
         })
 
@@ -146,30 +381,48 @@ class Orchestrator:
     def phase(self) -> Phase:
         return self._phase
 
-    def _transition(self, event_type: str) -> bool:
-        key = (self._phase, event_type)
-        next_phase = self.TRANSITIONS.get(key)
+    def _transition(self, event: Event) -> bool:
+        next_phase = self._TRANS[self._phase][event]
         if next_phase is None:
-            logger.debug("IGNORED: event '%s' illegal in phase %s", event_type, self._phase.name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("IGNORED: event '%s' illegal in phase %s", event.name.lower(), self._phase.name)
             return False
-        if next_phase == self._phase:
+        if next_phase is self._phase:
             return False
         old_phase = self._phase
         self._phase = next_phase
-        self._phase_entered_ts = time.time()
-        logger.info("PHASE: %s -> %s (event: %s)", old_phase.name, next_phase.name, event_type)
+        self._phase_entered_ts = self._wake_ts
+        timeout = self._phase_timeout(next_phase)
+        self._phase_deadline = self._phase_entered_ts + timeout if timeout is not None else math.inf
+        self._reschedule_deadlines()
+        logger.info("PHASE: %s -> %s (event: %s)", old_phase.name, next_phase.name, event.name.lower())
         return True
 
-    @staticmethod
-    def _normalize_direction(direction: Optional[str]) -> str:
-        allowed = {"forward", "backward", "left", "right", "stop", "scan"}
+    def _phase_timeout(self, phase: Phase) -> Optional[float]:
+        if phase is Phase.LISTENING:
+            return self.stt_timeout_s
+        if phase is Phase.ERROR:
+            return self.error_recovery_s
+        return None
+
+    def _reschedule_deadlines(self) -> None:
+        self._next_deadline = min(
+            self._phase_deadline,
+            self._vision_capture_deadline,
+            self._remote_session_deadline,
+        )
+
+    @classmethod
+    def _normalize_direction(cls, direction: Optional[str]) -> str:
         if not direction:
             return "stop"
-        value = str(direction).strip().lower()
-        return value if value in allowed else "stop"
+        if not isinstance(direction, str):
+            direction = str(direction)
+        value = direction.strip().lower()
+        return value if value in cls._ALLOWED_DIRECTIONS else "stop"
 
     def _enter_listening(self, from_wakeword: bool = False) -> None:
-        self._last_interaction_ts = time.time()
+        self._last_interaction_ts = self._wake_ts
         if from_wakeword:
             self._publish_led_state("wakeword_detected")
             self._publish_display_text("Wakeword detected")
@@ -177,13 +430,13 @@ class Orchestrator:
             self._publish_led_state("listening")
             self._publish_display_text("Listening...")
         if self.vision_mode != VisionMode.OFF:
-            publish_json(self.cmd_pub, TOPIC_CMD_PAUSE_VISION, {"pause": True, "source": "orchestrator"})
-        publish_json(self.cmd_pub, TOPIC_CMD_LISTEN_START, {"start": True, "source": "orchestrator"})
+            self._outbox.append((TOPIC_CMD_PAUSE_VISION, _PAUSE_VISION_ON))
+        self._outbox.append((TOPIC_CMD_LISTEN_START, _LISTEN_START))
 
     def _exit_listening(self, reason: str) -> None:
-        publish_json(self.cmd_pub, TOPIC_CMD_LISTEN_STOP, {"stop": True, "reason": reason, "source": "orchestrator"})
+        self._outbox.append((TOPIC_CMD_LISTEN_STOP, _LISTEN_STOP[reason]))
         if self.vision_mode != VisionMode.OFF:
-            publish_json(self.cmd_pub, TOPIC_CMD_PAUSE_VISION, {"pause": False, "source": "orchestrator"})
+            self._outbox.append((TOPIC_CMD_PAUSE_VISION, _PAUSE_VISION_OFF))
 
     def _enter_thinking(
         self,
@@ -193,8 +446,9 @@ class Orchestrator:
         source: str = "orchestrator",
         mode: Optional[str] = None,
     ) -> None:
+        snippet = text[:120]
         self._publish_led_state("thinking")
-        self._publish_display_text(f"Heard: {text[:120]}")
+        self._publish_display_text(f"Heard: {snippet}")
         payload: Dict[str, Any] = {"text": text}
         if vision:
             payload["vision"] = vision
@@ -204,8 +458,8 @@ class Orchestrator:
         payload["source"] = source
         if mode:
             payload["mode"] = mode
-        publish_json(self.cmd_pub, TOPIC_LLM_REQ, payload)
-        logger.info("LLM request text: %s", text[:120])
+        self._publish(TOPIC_LLM_REQ, payload)
+        logger.info("LLM request text: %s", snippet)
 
     def _enter_speaking(self, text: str, direction: Optional[str] = None) -> None:
         self._publish_led_state("tts_processing")
@@ -214,16 +468,12 @@ class Orchestrator:
         if normalized != "stop":
             if self._esp_obstacle and normalized == "forward":
                 logger.warning("Blocked forward command due to obstacle")
-                publish_json(
-                    self.cmd_pub,
-                    TOPIC_NAV,
-                    {"direction": "stop", "reason": "obstacle", "source": "orchestrator"},
-                )
+                self._outbox.append((TOPIC_NAV, _NAV_STOP_OBSTACLE))
                 self._last_nav_direction = "stop"
             else:
                 self._last_nav_direction = normalized
-                publish_json(self.cmd_pub, TOPIC_NAV, {"direction": normalized, "source": "orchestrator"})
-        publish_json(self.cmd_pub, TOPIC_TTS, {"text": text, "source": "orchestrator"})
+                self._outbox.append((TOPIC_NAV, self._NAV_PAYLOADS[normalized]))
+        self._publish(TOPIC_TTS, {"text": text, "source": "orchestrator"})
 
     def _enter_idle(self) -> None:
         self._publish_led_state("idle")
@@ -231,60 +481,49 @@ class Orchestrator:
         # Vision lifecycle is managed explicitly; do not auto-resume here.
 
     def _notify_stt_failure(self, reason: str) -> None:
-        feedback_messages = {
-            "timeout": [
-                "I didn't catch anything. Try again?",
-                "I lost you there. Say it once more.",
-                "I waited but heard nothing. Please try again.",
-            ],
-            "empty": [
-                "I couldn't make that out. Please speak clearly.",
-                "That came through empty. Try a bit louder.",
-                "I missed that. Please repeat.",
-            ],
-            "low_confidence": [
-                "I'm not sure I got that. Please repeat.",
-                "That was unclear. Say it again for me.",
-                "I didn't get enough confidence. Try again.",
-            ],
-        }
-        choices = feedback_messages.get(reason)
+        choices = _STT_FEEDBACK.get(reason)
         if choices:
-            message = random.choice(choices)
+            idx = self._stt_feedback_idx[reason]
+            message = choices[idx]
+            self._stt_feedback_idx[reason] = (idx + 1) % len(choices)
         else:
             message = "Something went wrong. Please try again."
-        publish_json(self.cmd_pub, TOPIC_TTS, {"text": message, "notification": True, "source": "orchestrator"})
+        self._publish(TOPIC_TTS, {"text": message, "notification": True, "source": "orchestrator"})
         logger.info("STT failure feedback: %s", reason)
 
     def on_wakeword(self, payload: Dict[str, Any]) -> None:
-        if self._phase != Phase.IDLE:
-            logger.debug("Wakeword ignored: not in IDLE (current: %s)", self._phase.name)
+        if self._phase is not Phase.IDLE:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Wakeword ignored: not in IDLE (current: %s)", self._phase.name)
             return
         logger.info("Wakeword detected: %s", payload.get("keyword", "unknown"))
-        if self._transition("wakeword"):
+        if self._transition(Event.WAKEWORD):
             self._enter_listening(from_wakeword=True)
 
     def on_manual_trigger(self, payload: Dict[str, Any]) -> None:
-        if self._phase != Phase.IDLE:
-            logger.debug("Manual trigger ignored: not in IDLE (current: %s)", self._phase.name)
+        if self._phase is not Phase.IDLE:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Manual trigger ignored: not in IDLE (current: %s)", self._phase.name)
             return
         logger.info("Manual trigger received")
-        if self._transition("manual_trigger"):
+        if self._transition(Event.MANUAL_TRIGGER):
             self._enter_listening(from_wakeword=False)
 
     def on_stt(self, payload: Dict[str, Any]) -> None:
-        if self._phase != Phase.LISTENING:
-            logger.debug("STT result ignored: not in LISTENING (current: %s)", self._phase.name)
+        if self._phase is not Phase.LISTENING:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("STT result ignored: not in LISTENING (current: %s)", self._phase.name)
             return
         text = str(payload.get("text", "")).strip()
         confidence = float(payload.get("confidence", 0.0) or 0.0)
-        logger.info("STT payload: text='%s' conf=%.2f", text[:120], confidence)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("STT payload: text='%s' conf=%.2f", text[:120], confidence)
         
         if not text:
             logger.warning("Empty transcription received")
             self._exit_listening("empty")
             self._notify_stt_failure("empty")
-            self._transition("stt_invalid")
+            self._transition(Event.STT_INVALID)
             self._enter_idle()
             return
         
@@ -292,7 +531,7 @@ class Orchestrator:
             logger.info("Low confidence (%.3f < %.3f): '%s'", confidence, self.stt_min_confidence, text[:50])
             self._exit_listening("low_confidence")
             self._notify_stt_failure("low_confidence")
-            self._transition("stt_invalid")
+            self._transition(Event.STT_INVALID)
             self._enter_idle()
             return
         
@@ -300,31 +539,30 @@ class Orchestrator:
         self._last_transcript = text
         self._exit_listening("success")
         
-        if self._transition("stt_valid"):
-            if self._should_request_vision(text):
+        if self._transition(Event.STT_VALID):
+            if self._should_request_vision(text.casefold()):
                 self._request_vision_capture(text)
             else:
                 self._enter_thinking(text)
 
-    def _should_request_vision(self, text: str) -> bool:
-        keywords = ["what do you see", "what are you seeing", "describe", "look at"]
-        return any(k in text.lower() for k in keywords)
+    def _should_request_vision(self, folded_text: str) -> bool:
+        return self._VISION_RE.search(folded_text) is not None
 
     def _request_vision_capture(self, text: str) -> None:
         if self.vision_mode == VisionMode.OFF:
             self._set_vision_mode(VisionMode.ON_NO_STREAM, source="internal")
-        request_id = f"visn-{int(time.time() * 1000)}"
+        request_id = f"visn-{self._event_ts}-{next(self._request_seq)}"
         self._vision_capture_pending = request_id
-        self._vision_capture_requested_ts = time.time()
+        self._vision_capture_deadline = self._wake_ts + self.VISION_CAPTURE_TIMEOUT_S
+        self._reschedule_deadlines()
         self._last_transcript = text
-        publish_json(self.cmd_pub, TOPIC_CMD_VISN_CAPTURE, {"request_id": request_id, "source": "orchestrator"})
+        self._publish(TOPIC_CMD_VISN_CAPTURE, {"request_id": request_id, "source": "orchestrator"})
 
     def _request_frame_capture(self, source: str) -> str:
         if self.vision_mode == VisionMode.OFF:
             self._set_vision_mode(VisionMode.ON_NO_STREAM, source=source)
-        request_id = f"capture-{int(time.time() * 1000)}"
-        publish_json(
-            self.cmd_pub,
+        request_id = f"capture-{self._event_ts}-{next(self._request_seq)}"
+        self._publish(
             TOPIC_CMD_VISN_CAPTURE,
             {"request_id": request_id, "source": source, "save": True, "purpose": "capture_frame"},
         )
@@ -336,13 +574,15 @@ class Orchestrator:
             request_id = payload.get("request_id")
             if request_id == self._vision_capture_pending:
                 self._vision_capture_pending = None
-                self._vision_capture_requested_ts = None
-                if self._phase == Phase.THINKING:
+                self._vision_capture_deadline = math.inf
+                self._reschedule_deadlines()
+                if self._phase is Phase.THINKING:
                     self._enter_thinking(self._last_transcript, vision=payload)
 
     def on_llm(self, payload: Dict[str, Any]) -> None:
-        if self._phase != Phase.THINKING:
-            logger.debug("LLM response ignored: not in THINKING (current: %s)", self._phase.name)
+        if self._phase is not Phase.THINKING:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("LLM response ignored: not in THINKING (current: %s)", self._phase.name)
             return
         logger.info("LLM response received")
         body = payload.get("json") or {}
@@ -352,34 +592,36 @@ class Orchestrator:
             direction = "stop"
             if speak:
                 speak = f"{speak} Obstacle ahead, stopping."
-        logger.info("LLM response speak: %s", (speak or "")[:120])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("LLM response speak: %s", (speak or "")[:120])
         
         if speak:
-            if self._transition("llm_with_speech"):
+            if self._transition(Event.LLM_WITH_SPEECH):
                 self._enter_speaking(speak, direction)
         else:
             logger.info("LLM response has no speak text; TTS skipped")
             self._publish_remote_event("tts_skipped", {"reason": "empty_speak"})
             if direction and direction != "stop":
-                publish_json(self.cmd_pub, TOPIC_NAV, {"direction": direction, "source": "orchestrator"})
+                self._outbox.append((TOPIC_NAV, self._NAV_PAYLOADS[direction]))
                 self._last_nav_direction = direction
-            self._transition("llm_no_speech")
+            self._transition(Event.LLM_NO_SPEECH)
             self._enter_idle()
 
     def on_tts(self, payload: Dict[str, Any]) -> None:
         if payload.get("started"):
             self._publish_led_state("speaking")
             return
-        done = payload.get("done") or payload.get("final") or payload.get("completed")
-        if payload.get("notification"):
+        # Notifications and in-progress chunks (the common case) stop here.
+        if payload.get("notification") or not (
+            payload.get("done") or payload.get("final") or payload.get("completed")
+        ):
             return
-        if not done:
-            return
-        if self._phase != Phase.SPEAKING:
-            logger.debug("TTS done ignored: not in SPEAKING (current: %s)", self._phase.name)
+        if self._phase is not Phase.SPEAKING:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("TTS done ignored: not in SPEAKING (current: %s)", self._phase.name)
             return
         logger.info("TTS completed")
-        if self._transition("tts_done"):
+        if self._transition(Event.TTS_DONE):
             self._enter_idle()
 
     def on_esp(self, payload: Dict[str, Any]) -> None:
@@ -390,7 +632,7 @@ class Orchestrator:
             if self._esp_obstacle and not self._obstacle_latched:
                 self._obstacle_latched = True
                 logger.warning("Obstacle detected by ESP32; forcing stop")
-                publish_json(self.cmd_pub, TOPIC_NAV, {"direction": "stop", "reason": "obstacle"})
+                self._outbox.append((TOPIC_NAV, _ESP_STOP_OBSTACLE))
                 self._last_nav_direction = "stop"
                 self._publish_display_text("Obstacle detected - stopping")
             elif not self._esp_obstacle and self._obstacle_latched:
@@ -399,61 +641,65 @@ class Orchestrator:
         alert = payload.get("alert")
         if alert == "COLLISION":
             logger.critical("ESP32 collision alert!")
-            publish_json(self.cmd_pub, TOPIC_NAV, {"direction": "stop", "reason": "collision"})
+            self._outbox.append((TOPIC_NAV, _ESP_STOP_COLLISION))
             self._last_nav_direction = "stop"
 
     def on_health(self, payload: Dict[str, Any]) -> None:
         ok = bool(payload.get("ok", True))
-        if not ok and self._phase != Phase.ERROR:
+        if not ok and self._phase is not Phase.ERROR:
             logger.error("Health error: %s", payload)
             self._publish_led_state("error")
-            self._transition("health_error")
-        elif ok and self._phase == Phase.ERROR:
+            self._transition(Event.HEALTH_ERROR)
+        elif ok and self._phase is Phase.ERROR:
             logger.info("Health restored")
-            self._transition("health_ok")
+            self._transition(Event.HEALTH_OK)
             self._enter_idle()
 
-    def _check_timeouts(self) -> None:
-        now = time.time()
-        elapsed = now - self._phase_entered_ts
-        if self._phase == Phase.LISTENING and elapsed > self.stt_timeout_s:
-            logger.warning("STT timeout (%.1fs)", self.stt_timeout_s)
-            self._exit_listening("timeout")
-            self._notify_stt_failure("timeout")
-            self._transition("stt_timeout")
-            self._enter_idle()
-        elif self._phase == Phase.ERROR and elapsed > self.error_recovery_s:
-            logger.info("Error auto-recovery after %.1fs", self.error_recovery_s)
-            self._transition("error_timeout")
-            self._publish_display_text("Recovered. Ready.")
-            self._enter_idle()
-
-        if self._vision_capture_pending and self._vision_capture_requested_ts:
-            if (now - self._vision_capture_requested_ts) > 3.0:
+    def _check_timeouts(self, now: float) -> None:
+        if now <= self._next_deadline:
+            return
+        if now > self._phase_deadline:
+            if self._phase is Phase.LISTENING:
+                logger.warning("STT timeout (%.1fs)", self.stt_timeout_s)
+                self._exit_listening("timeout")
+                self._notify_stt_failure("timeout")
+                self._transition(Event.STT_TIMEOUT)
+                self._enter_idle()
+            elif self._phase is Phase.ERROR:
+                logger.info("Error auto-recovery after %.1fs", self.error_recovery_s)
+                self._transition(Event.ERROR_TIMEOUT)
+                self._publish_display_text("Recovered. Ready.")
+                self._enter_idle()
+
+        if now > self._vision_capture_deadline:
+            self._vision_capture_deadline = math.inf
+            if self._vision_capture_pending:
                 logger.warning("Vision capture timeout; proceeding without vision")
                 self._vision_capture_pending = None
-                self._vision_capture_requested_ts = None
-                if self._phase == Phase.THINKING:
+                if self._phase is Phase.THINKING:
                     self._enter_thinking(self._last_transcript)
 
-        if self._remote_session_active and self._remote_last_seen:
-            if (now - self._remote_last_seen) > self.remote_session_timeout_s:
+        if now > self._remote_session_deadline:
+            self._remote_session_deadline = math.inf
+            if self._remote_session_active:
                 self._remote_session_active = False
-                publish_json(self.cmd_pub, TOPIC_REMOTE_SESSION, {
+                self._publish(TOPIC_REMOTE_SESSION, {
                     "active": False,
                     "last_seen": int(self._remote_last_seen) if self._remote_last_seen else None,
                     "source": "orchestrator",
                 })
 
-    def _check_auto_trigger(self) -> None:
+        self._reschedule_deadlines()
+
+    def _check_auto_trigger(self, now: float) -> None:
         if not self.auto_trigger_enabled:
             return
-        if self._phase != Phase.IDLE:
+        if self._phase is not Phase.IDLE:
             return
-        idle_time = time.time() - self._last_interaction_ts
+        idle_time = now - self._last_interaction_ts
         if idle_time > self.auto_trigger_interval:
             logger.info("Auto-trigger after %.1fs idle", idle_time)
-            if self._transition("auto_trigger"):
+            if self._transition(Event.AUTO_TRIGGER):
                 self._enter_listening(from_wakeword=False)
 
     def run(self) -> None:
@@ -466,50 +712,91 @@ class Orchestrator:
         logger.info("Initial phase: %s", self._phase.name)
         self._publish_led_state("idle")
         self._set_vision_mode(self.vision_mode, source="internal")
+        self._flush()
 
         poller = zmq.Poller()
         poller.register(self.events_sub, zmq.POLLIN)
 
+        # Bind hot-loop lookups to locals once.
+        events_sub = self.events_sub
+        poll = poller.poll
+        recv = events_sub.recv_multipart
+        loads = loads_json
+        handler_for = self._handlers.get
+        check_timeouts = self._check_timeouts
+        check_auto_trigger = self._check_auto_trigger
+        flush = self._flush
+        monotonic = time.monotonic
+        noblock = zmq.NOBLOCK
+        poll_timeout_for = self._POLL_TIMEOUT_MS.get
+        default_poll_timeout = self._DEFAULT_POLL_TIMEOUT_MS
+        max_drain = self._MAX_DRAIN
+
         while True:
-            socks = dict(poller.poll(timeout=100))
-            if self.events_sub in socks:
-                try:
-                    topic, data = self.events_sub.recv_multipart()
-                    if topic == TOPIC_VISN_FRAME:
-                        self.cmd_pub.send_multipart([topic, data])
+            phase = self._phase
+            timeout_ms = poll_timeout_for(phase, default_poll_timeout)
+            # Wake in time for the earliest armed deadline even on a slow cadence.
+            due = self._next_deadline
+            if phase is Phase.IDLE and self.auto_trigger_enabled:
+                due = min(due, self._last_interaction_ts + self.auto_trigger_interval)
+            due_ms = (due - monotonic()) * 1000.0
+            if due_ms < timeout_ms:
+                timeout_ms = max(0, int(due_ms) + 1)
+            ready = poll(timeout=timeout_ms)
+            # One monotonic sample serves the handlers and periodic checks this wake-up.
+            now = self._wake_ts = monotonic()
+            self._event_ts = int(time.time())
+            if ready:
+                # Drain what is already queued, capped so a flood cannot starve
+                # the periodic checks; leftovers make the next poll return at once.
+                for _ in range(max_drain):
+                    try:
+                        topic, data = recv(noblock)
+                    except zmq.Again:
+                        break
+                    except ValueError as exc:
+                        logger.error("Recv/parse error: %s", exc)
+                        continue
+                    try:
+                        payload = loads(data)
+                    except ValueError as exc:
+                        logger.error("Recv/parse error: %s", exc)
                         continue
-                    payload = json.loads(data)
-                except Exception as exc:
-                    logger.error("Recv/parse error: %s", exc)
-                    continue
-
-                if topic == TOPIC_WW_DETECTED:
-                    self.on_wakeword(payload)
-                elif topic == TOPIC_CMD_LISTEN_START:
-                    self.on_manual_trigger(payload)
-                elif topic == TOPIC_STT:
-                    self.on_stt(payload)
-                elif topic == TOPIC_LLM_RESP:
-                    self.on_llm(payload)
-                elif topic == TOPIC_TTS:
-                    self.on_tts(payload)
-                elif topic == TOPIC_VISN:
-                    self.on_vision(payload)
-                    publish_json(self.cmd_pub, TOPIC_VISN, payload)
-                elif topic == TOPIC_VISN_CAPTURED:
-                    publish_json(self.cmd_pub, TOPIC_VISN_CAPTURED, payload)
-                elif topic == TOPIC_ESP:
-                    self.on_esp(payload)
-                    publish_json(self.cmd_pub, TOPIC_ESP, payload)
-                elif topic == TOPIC_HEALTH:
-                    self.on_health(payload)
-                elif topic == TOPIC_REMOTE_SESSION:
-                    self.on_remote_session(payload)
-                elif topic == TOPIC_REMOTE_INTENT:
-                    self.on_remote_intent(payload)
-
-            self._check_timeouts()
-            self._check_auto_trigger()
+                    handler = handler_for(topic)
+                    if handler is not None:
+                        handler(payload)
+
+            check_timeouts(now)
+            check_auto_trigger(now)
+            # One burst per wake-up for everything the handlers above staged.
+            flush()
+
+    def _build_handlers(self) -> Dict[bytes, Callable[[Any], None]]:
+        """Map each inbound JSON topic to its bound handler for run()."""
+        return {
+            TOPIC_WW_DETECTED: self.on_wakeword,
+            TOPIC_CMD_LISTEN_START: self.on_manual_trigger,
+            TOPIC_STT: self.on_stt,
+            TOPIC_LLM_RESP: self.on_llm,
+            TOPIC_TTS: self.on_tts,
+            TOPIC_VISN: self._on_vision_relay,
+            TOPIC_VISN_CAPTURED: self._relay_vision_captured,
+            TOPIC_ESP: self._on_esp_relay,
+            TOPIC_HEALTH: self.on_health,
+            TOPIC_REMOTE_SESSION: self.on_remote_session,
+            TOPIC_REMOTE_INTENT: self.on_remote_intent,
+        }
+
+    def _on_vision_relay(self, payload: Dict[str, Any]) -> None:
+        self.on_vision(payload)
+        self._publish(TOPIC_VISN, payload)
+
+    def _relay_vision_captured(self, payload: Dict[str, Any]) -> None:
+        self._publish(TOPIC_VISN_CAPTURED, payload)
+
+    def _on_esp_relay(self, payload: Dict[str, Any]) -> None:
+        self.on_esp(payload)
+        self._publish(TOPIC_ESP, payload)
 
     def _coerce_vision_mode(self, raw: str) -> VisionMode:
         raw = (raw or "").lower().strip()
@@ -523,21 +810,36 @@ class Orchestrator:
         if mode == self.vision_mode:
             return
         self.vision_mode = mode
-        publish_json(
-            self.cmd_pub,
+        self._publish(
             TOPIC_CMD_VISION_MODE,
-            {"mode": mode.value, "timestamp": int(time.time()), "source": source},
+            {"mode": mode.value, "timestamp": self._event_ts, "source": source},
         )
 
     def _publish_remote_event(self, event: str, payload: Dict[str, Any]) -> None:
-        message = {"event": event, "timestamp": int(time.time()), **payload}
-        publish_json(self.cmd_pub, TOPIC_REMOTE_EVENT, message)
+        message = {"event": event, "timestamp": self._event_ts, **payload}
+        self._publish(TOPIC_REMOTE_EVENT, message)
 
     def on_remote_session(self, payload: Dict[str, Any]) -> None:
         active = bool(payload.get("active", False))
         self._remote_session_active = active
         if active:
             self._remote_last_seen = time.time()
+            self._remote_session_deadline = self._wake_ts + self.remote_session_timeout_s
+        else:
+            self._remote_session_deadline = math.inf
+        self._reschedule_deadlines()
+
+    def _publish_remote_nav(self, intent: str, direction: str, payload: Dict[str, Any]) -> None:
+        command = {"direction": direction, "source": "remote_app"}
+        logger.info(
+            "nav.command publish intent=%s direction=%s speed=%s duration=%s payload=%s",
+            intent,
+            direction,
+            payload.get("speed"),
+            payload.get("duration"),
+            command,
+        )
+        self._publish(TOPIC_NAV, command)
 
     def on_remote_intent(self, payload: Dict[str, Any]) -> None:
         source = payload.get("source", "unknown")
@@ -558,33 +860,41 @@ class Orchestrator:
             self._publish_remote_event("rejected", {"reason": "missing_intent", "payload": payload})
             return
 
-        if intent in {"enable_vision", "enable_perception"}:
-            self._set_vision_mode(VisionMode.ON_NO_STREAM, source="remote_app")
-            logger.info("remote_intent accepted intent=%s", intent)
-            self._publish_remote_event("accepted", {"intent": intent})
-            return
-        if intent in {"disable_vision", "disable_perception"}:
-            self._set_vision_mode(VisionMode.OFF, source="remote_app")
+        vision_mode = self._INTENT_VISION_MODE.get(intent)
+        if vision_mode is not None:
+            self._set_vision_mode(vision_mode, source="remote_app")
             logger.info("remote_intent accepted intent=%s", intent)
             self._publish_remote_event("accepted", {"intent": intent})
             return
-        if intent in {"enable_stream"}:
-            self._set_vision_mode(VisionMode.ON_WITH_STREAM, source="remote_app")
-            logger.info("remote_intent accepted intent=%s", intent)
-            self._publish_remote_event("accepted", {"intent": intent})
+        nav = self._INTENT_NAV.get(intent)
+        if nav is not None:
+            direction, report_direction = nav
+            self._publish_remote_nav(intent, direction, payload)
+            if report_direction:
+                logger.info("remote_intent accepted intent=%s direction=%s", intent, direction)
+                self._publish_remote_event("accepted", {"intent": intent, "direction": direction})
+            else:
+                logger.info("remote_intent accepted intent=%s", intent)
+                self._publish_remote_event("accepted", {"intent": intent})
             return
-        if intent in {"disable_stream"}:
-            self._set_vision_mode(VisionMode.ON_NO_STREAM, source="remote_app")
-            logger.info("remote_intent accepted intent=%s", intent)
-            self._publish_remote_event("accepted", {"intent": intent})
+        default_direction = self._INTENT_MOTION.get(intent)
+        if default_direction is not None:
+            direction = str(payload.get("direction", "")).strip().lower() or default_direction
+            if direction not in self._MOTION_DIRECTIONS:
+                logger.warning("remote_intent rejected reason=invalid_direction payload=%s", payload)
+                self._publish_remote_event("rejected", {"reason": "invalid_direction", "payload": payload})
+                return
+            self._publish_remote_nav(intent, direction, payload)
+            logger.info("remote_intent accepted intent=%s direction=%s", intent, direction)
+            self._publish_remote_event("accepted", {"intent": intent, "direction": direction})
             return
-        if intent in {"capture_frame"}:
+        if intent == "capture_frame":
             request_id = self._request_frame_capture("remote_app")
             logger.info("remote_intent accepted intent=%s request_id=%s", intent, request_id)
             self._publish_remote_event("accepted", {"intent": intent, "request_id": request_id})
             return
-        if intent in {"invoke_assistant"}:
-            if self._transition("manual_think"):
+        if intent == "invoke_assistant":
+            if self._transition(Event.MANUAL_THINK):
                 text = str(payload.get("text", "manual_invoke")).strip() or "manual_invoke"
                 self._last_transcript = text
                 self._enter_thinking(text, source="remote_app", mode="manual_invoke")
@@ -594,13 +904,13 @@ class Orchestrator:
                 logger.warning("remote_intent rejected reason=busy payload=%s", payload)
                 self._publish_remote_event("rejected", {"reason": "busy", "payload": payload})
             return
-        if intent in {"assistant_text"}:
+        if intent == "assistant_text":
             text = str(payload.get("text", "")).strip()
             if not text:
                 logger.warning("remote_intent rejected reason=missing_text payload=%s", payload)
                 self._publish_remote_event("rejected", {"reason": "missing_text", "payload": payload})
                 return
-            if self._transition("manual_text"):
+            if self._transition(Event.MANUAL_TEXT):
                 self._last_transcript = text
                 self._enter_thinking(text, source="remote_app", mode="manual_text")
                 logger.info("remote_intent accepted intent=%s", intent)
@@ -609,68 +919,6 @@ class Orchestrator:
                 logger.warning("remote_intent rejected reason=busy payload=%s", payload)
                 self._publish_remote_event("rejected", {"reason": "busy", "payload": payload})
             return
-        if intent in {"scan", "start_scan"}:
-            logger.info(
-                "nav.command publish intent=%s direction=scan speed=%s duration=%s payload=%s",
-                intent,
-                payload.get("speed"),
-                payload.get("duration"),
-                {"direction": "scan", "source": "remote_app"},
-            )
-            publish_json(self.cmd_pub, TOPIC_NAV, {"direction": "scan", "source": "remote_app"})
-            logger.info("remote_intent accepted intent=%s", intent)
-            self._publish_remote_event("accepted", {"intent": intent})
-            return
-        if intent in {"stop", "stop_motion"}:
-            logger.info(
-                "nav.command publish intent=%s direction=stop speed=%s duration=%s payload=%s",
-                intent,
-                payload.get("speed"),
-                payload.get("duration"),
-                {"direction": "stop", "source": "remote_app"},
-            )
-            publish_json(self.cmd_pub, TOPIC_NAV, {"direction": "stop", "source": "remote_app"})
-            logger.info("remote_intent accepted intent=%s", intent)
-            self._publish_remote_event("accepted", {"intent": intent})
-            return
-        if intent in {"move_backward"}:
-            logger.info(
-                "nav.command publish intent=%s direction=backward speed=%s duration=%s payload=%s",
-                intent,
-                payload.get("speed"),
-                payload.get("duration"),
-                {"direction": "backward", "source": "remote_app"},
-            )
-            publish_json(self.cmd_pub, TOPIC_NAV, {"direction": "backward", "source": "remote_app"})
-            logger.info("remote_intent accepted intent=%s direction=backward", intent)
-            self._publish_remote_event("accepted", {"intent": intent, "direction": "backward"})
-            return
-        if intent in {"rotate", "rotate_left", "rotate_right", "start_motion", "start"}:
-            direction = str(payload.get("direction", "")).strip().lower()
-            if not direction:
-                if intent == "rotate_left":
-                    direction = "left"
-                elif intent == "rotate_right":
-                    direction = "right"
-                elif intent in {"start_motion", "start"}:
-                    direction = "forward"
-
-            if direction not in {"forward", "backward", "left", "right"}:
-                logger.warning("remote_intent rejected reason=invalid_direction payload=%s", payload)
-                self._publish_remote_event("rejected", {"reason": "invalid_direction", "payload": payload})
-                return
-            logger.info(
-                "nav.command publish intent=%s direction=%s speed=%s duration=%s payload=%s",
-                intent,
-                direction,
-                payload.get("speed"),
-                payload.get("duration"),
-                {"direction": direction, "source": "remote_app"},
-            )
-            publish_json(self.cmd_pub, TOPIC_NAV, {"direction": direction, "source": "remote_app"})
-            logger.info("remote_intent accepted intent=%s direction=%s", intent, direction)
-            self._publish_remote_event("accepted", {"intent": intent, "direction": direction})
-            return
 
         logger.warning("remote_intent rejected reason=unsupported_intent payload=%s", payload)
         self._publish_remote_event("rejected", {"reason": "unsupported_intent", "payload": payload})
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
-from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, NamedTuple, Optional
 
 import zmq
 
@@ -15,6 +13,7 @@ from src.core.ipc import (
     TOPIC_ESP,
     TOPIC_NAV,
     TOPIC_VISN,
+    loads_json,
     make_subscriber,
 )
 from src.core.logging_setup import get_logger
@@ -22,31 +21,29 @@ from src.core.logging_setup import get_logger
 logger = get_logger("world.context", Path("logs"))
 
 
-@dataclass
-class _TimedValue:
-    value: Optional[Dict[str, Any]] = None
-    received_ts: Optional[float] = None
+class _State(NamedTuple):
+    """Immutable last-known values; replaced wholesale, never mutated.
 
-    def update(self, value: Dict[str, Any], ts: Optional[float] = None) -> None:
-        self.value = value
-        self.received_ts = ts if ts is not None else time.time()
+    Timestamps are ``time.monotonic()`` readings, used only for ages.
+    """
 
-
-@dataclass
-class WorldSnapshot:
-    vision: Dict[str, Any] = field(default_factory=dict)
-    sensors: Dict[str, Any] = field(default_factory=dict)
-    robot_state: Dict[str, Any] = field(default_factory=dict)
-    generated_at: int = 0
+    vision: Optional[Dict[str, Any]] = None
+    vision_ts: Optional[float] = None
+    sensors: Optional[Dict[str, Any]] = None
+    sensors_ts: Optional[float] = None
+    robot: Optional[Dict[str, Any]] = None
+    robot_ts: Optional[float] = None
 
 
 class WorldContextAggregator:
+    # Messages folded into one published state; leftovers are picked up next poll.
+    _MAX_BATCH = 64
+
     def __init__(self, config: Dict[str, Any]) -> None:
         self.config = config
-        self._vision = _TimedValue()
-        self._sensors = _TimedValue()
-        self._robot = _TimedValue()
-        self._lock = threading.Lock()
+        # Only the aggregator thread assigns _state; readers take one reference
+        # to it, so no lock is needed on either side.
+        self._state = _State()
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
@@ -63,6 +60,15 @@ class WorldContextAggregator:
         self._poller.register(self._sub_up, zmq.POLLIN)
         self._poller.register(self._sub_down, zmq.POLLIN)
 
+        # topic -> handler(state, payload, now) returning the next state.
+        self._handlers: Dict[bytes, Callable[[_State, Dict[str, Any], float], _State]] = {
+            TOPIC_VISN: self._handle_vision,
+            TOPIC_ESP: self._handle_esp,
+            TOPIC_DISPLAY_STATE: self._handle_display_state,
+            TOPIC_NAV: self._handle_nav,
+            TOPIC_CMD_VISION_MODE: self._handle_vision_mode,
+        }
+
     def start(self) -> None:
         if self._running:
             return
@@ -75,88 +81,104 @@ class WorldContextAggregator:
         self._running = False
 
     def _loop(self) -> None:
+        poll = self._poller.poll
+        drain = self._drain
         while self._running:
-            events = dict(self._poller.poll(timeout=200))
-            if self._sub_up in events:
-                self._drain(self._sub_up)
-            if self._sub_down in events:
-                self._drain(self._sub_down)
+            for sock, _ in poll(timeout=200):
+                drain(sock)
 
     def _drain(self, sock: zmq.Socket) -> None:
-        while True:
+        # Parse the queued batch, fold it into a new state and publish that
+        # with a single reference assignment.
+        batch = []
+        recv = sock.recv_multipart
+        get_handler = self._handlers.get
+        for _ in range(self._MAX_BATCH):
             try:
-                topic, raw = sock.recv_multipart(flags=zmq.NOBLOCK)
+                topic, raw = recv(flags=zmq.NOBLOCK)
             except zmq.Again:
                 break
+            handler = get_handler(topic)
+            # Every handler expects a JSON object; reject anything else
+            # with one byte compare instead of a parse and exception.
+            if handler is None or raw[:1] != b"{":
+                continue
             try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
+                payload = loads_json(raw)
+            except ValueError:
                 continue
+            batch.append((handler, payload))
+        if not batch:
+            return
+
+        now = time.monotonic()
+        state = self._state
+        for handler, payload in batch:
+            state = handler(state, payload, now)
+        self._state = state
+
+    @staticmethod
+    def _handle_vision(state: _State, payload: Dict[str, Any], now: float) -> _State:
+        vision = {
+            "label": payload.get("label"),
+            "bbox": payload.get("bbox"),
+            "confidence": payload.get("confidence"),
+            "ts": payload.get("ts"),
+            "request_id": payload.get("request_id"),
+        }
+        return state._replace(vision=vision, vision_ts=now)
 
-            now = time.time()
-            with self._lock:
-                if topic == TOPIC_VISN:
-                    vision = {
-                        "label": payload.get("label"),
-                        "bbox": payload.get("bbox"),
-                        "confidence": payload.get("confidence"),
-                        "ts": payload.get("ts"),
-                        "request_id": payload.get("request_id"),
-                    }
-                    self._vision.update(vision, ts=now)
-                elif topic == TOPIC_ESP:
-                    sensors = {
-                        "data": payload.get("data"),
-                        "alert": payload.get("alert"),
-                        "blocked": payload.get("blocked"),
-                        "reason": payload.get("reason"),
-                    }
-                    self._sensors.update(sensors, ts=now)
-                elif topic == TOPIC_DISPLAY_STATE:
-                    robot = self._robot.value or {}
-                    robot = {**robot, "mode": payload.get("state")}
-                    self._robot.update(robot, ts=now)
-                elif topic == TOPIC_NAV:
-                    robot = self._robot.value or {}
-                    robot = {**robot, "motion": payload.get("direction")}
-                    self._robot.update(robot, ts=now)
-                elif topic == TOPIC_CMD_VISION_MODE:
-                    robot = self._robot.value or {}
-                    robot = {**robot, "vision_mode": payload.get("mode")}
-                    self._robot.update(robot, ts=now)
+    @staticmethod
+    def _handle_esp(state: _State, payload: Dict[str, Any], now: float) -> _State:
+        sensors = {
+            "data": payload.get("data"),
+            "alert": payload.get("alert"),
+            "blocked": payload.get("blocked"),
+            "reason": payload.get("reason"),
+        }
+        return state._replace(sensors=sensors, sensors_ts=now)
+
+    @staticmethod
+    def _handle_display_state(state: _State, payload: Dict[str, Any], now: float) -> _State:
+        robot = {**(state.robot or {}), "mode": payload.get("state")}
+        return state._replace(robot=robot, robot_ts=now)
+
+    @staticmethod
+    def _handle_nav(state: _State, payload: Dict[str, Any], now: float) -> _State:
+        robot = {**(state.robot or {}), "motion": payload.get("direction")}
+        return state._replace(robot=robot, robot_ts=now)
+
+    @staticmethod
+    def _handle_vision_mode(state: _State, payload: Dict[str, Any], now: float) -> _State:
+        robot = {**(state.robot or {}), "vision_mode": payload.get("mode")}
+        return state._replace(robot=robot, robot_ts=now)
 
     def get_snapshot(self) -> Dict[str, Any]:
-        now = time.time()
-        with self._lock:
-            vision_age = self._age_ms(self._vision.received_ts, now)
-            sensors_age = self._age_ms(self._sensors.received_ts, now)
-            robot_age = self._age_ms(self._robot.received_ts, now)
-
-            snapshot = WorldSnapshot(
-                vision={
-                    "last_known": self._vision.value,
-                    "age_ms": vision_age,
-                    "stale": self._is_stale(vision_age),
-                },
-                sensors={
-                    "last_known": self._sensors.value,
-                    "age_ms": sensors_age,
-                    "stale": self._is_stale(sensors_age),
-                },
-                robot_state={
-                    "last_known": self._robot.value,
-                    "age_ms": robot_age,
-                    "stale": self._is_stale(robot_age),
-                },
-                generated_at=int(now),
-            )
-            return {
-                "vision": snapshot.vision,
-                "sensors": snapshot.sensors,
-                "robot_state": snapshot.robot_state,
-                "generated_at": snapshot.generated_at,
-                "context_type": "last_known_state",
-            }
+        now = time.monotonic()
+        state = self._state
+        vision_age = self._age_ms(state.vision_ts, now)
+        sensors_age = self._age_ms(state.sensors_ts, now)
+        robot_age = self._age_ms(state.robot_ts, now)
+
+        return {
+            "vision": {
+                "last_known": state.vision,
+                "age_ms": vision_age,
+                "stale": self._is_stale(vision_age),
+            },
+            "sensors": {
+                "last_known": state.sensors,
+                "age_ms": sensors_age,
+                "stale": self._is_stale(sensors_age),
+            },
+            "robot_state": {
+                "last_known": state.robot,
+                "age_ms": robot_age,
+                "stale": self._is_stale(robot_age),
+            },
+            "generated_at": int(time.time()),
+            "context_type": "last_known_state",
+        }
 
     @staticmethod
     def _age_ms(ts: Optional[float], now: float) -> Optional[int]:
@@ -13,7 +13,6 @@ Environment variables (no API keys in code):
 """
 from __future__ import annotations
 
-import json
 import os
 import random
 import signal
@@ -29,15 +28,21 @@ from src.core.config_loader import load_config
 from src.core.ipc import (
     TOPIC_LLM_REQ,
     TOPIC_LLM_RESP,
+    dumps_json,
+    loads_json,
     make_publisher,
     make_subscriber,
     publish_json,
 )
 from src.core.logging_setup import get_logger
 from src.llm.conversation_memory import ConversationMemory
+from src.llm.response_cache import ResponseCache
 
 
 class AzureOpenAIRunner:
+    # Requests taken off the socket per wake-up, then handled in order.
+    _MAX_BATCH = 16
+
     def __init__(self) -> None:
         self.config = load_config(Path("config/system.yaml"))
         logs_cfg = self.config.get("logs", {}) or {}
@@ -76,6 +81,8 @@ class AzureOpenAIRunner:
             max_turns=int(llm_cfg.get("memory_max_turns", 10)),
             conversation_timeout_s=float(llm_cfg.get("conversation_timeout_s", 120.0)),
         )
+        # Informational replies reused for repeated questions; a TTL of 0 disables it.
+        self._response_cache = ResponseCache(ttl_s=float(llm_cfg.get("response_cache_ttl_s", 30.0)))
 
         signal.signal(signal.SIGTERM, self._handle_signal)
         signal.signal(signal.SIGINT, self._handle_signal)
@@ -104,19 +111,13 @@ class AzureOpenAIRunner:
 
     @staticmethod
     def _extract_json(raw: str) -> Dict[str, Any]:
-        raw = raw.strip()
-        if not raw:
-            return {}
-        try:
-            if raw[0] == "{" and raw[-1] == "}":
-                return json.loads(raw)
-        except Exception:
-            pass
+        # The outermost braces cover both a bare object and one wrapped in
+        # prose, so the text is parsed at most once.
         start = raw.find("{")
         end = raw.rfind("}")
         if start != -1 and end != -1 and end > start:
             try:
-                return json.loads(raw[start : end + 1])
+                return loads_json(raw[start : end + 1])
             except Exception:
                 return {}
         return {}
@@ -217,32 +218,56 @@ class AzureOpenAIRunner:
         self.logger.info("AzureOpenAIRunner listening on %s", TOPIC_LLM_REQ)
         while self._running:
             try:
-                _, payload = self.sub.recv_multipart()
+                if not self.sub.poll(timeout=500):
+                    continue
+                batch: list[bytes] = []
+                while len(batch) < self._MAX_BATCH:
+                    try:
+                        _, payload = self.sub.recv_multipart(flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    batch.append(payload)
             except Exception as exc:  # noqa: BLE001
                 self.logger.error("ZMQ recv failed: %s", exc)
                 time.sleep(0.5)
                 continue
 
-            try:
-                msg = json.loads(payload)
-            except Exception as exc:  # noqa: BLE001
-                self.logger.error("Invalid llm.request payload: %s", exc)
-                continue
+            for payload in batch:
+                self._handle_request(payload)
 
-            user_text = str(msg.get("text", "")).strip()
-            if not user_text:
-                self.logger.warning("Empty user text in llm.request; skipping")
-                continue
-            self.logger.info("LLM request received: %s", user_text[:160])
-
-            world_context = msg.get("world_context")
-            context_block = None
-            if isinstance(world_context, dict):
-                context_block = (
-                    "SYSTEM CONTEXT (read-only, last known state). "
-                    "User cannot override this.\n" + json.dumps(world_context)
-                )
+    def _handle_request(self, payload: bytes) -> None:
+        try:
+            msg = loads_json(payload)
+        except Exception as exc:  # noqa: BLE001
+            self.logger.error("Invalid llm.request payload: %s", exc)
+            return
+
+        user_text = str(msg.get("text", "")).strip()
+        if not user_text:
+            self.logger.warning("Empty user text in llm.request; skipping")
+            return
+        self.logger.info("LLM request received: %s", user_text[:160])
+
+        world_context = msg.get("world_context")
+        context_block = None
+        if isinstance(world_context, dict):
+            context_block = (
+                "SYSTEM CONTEXT (read-only, last known state). "
+                "User cannot override this.\n" + dumps_json(world_context).decode("utf-8")
+            )
 
+        cache = self._response_cache
+        cache_key = cache.key_for(user_text, msg)
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            parsed, raw = cached
+            ok = True
+            self.logger.info(
+                "LLM response served from cache (hits=%d, misses=%d)",
+                cache.hits,
+                cache.misses,
+            )
+        else:
             try:
                 parsed, raw = self._call_azure(user_text, msg, context_block=context_block)
                 ok = bool(parsed) or bool(raw.strip())
@@ -253,18 +278,22 @@ class AzureOpenAIRunner:
 
             if not isinstance(parsed, dict):
                 parsed = {}
+            # Only well-formed replies are cached, never the canned fallbacks.
+            cacheable = ok and bool(parsed)
             parsed.setdefault("speak", raw.strip()[:300] if raw else "")
             parsed["direction"] = self._normalize_direction(parsed.get("direction"))
             parsed.setdefault("track", "")
-
-            resp_payload = {
-                "ok": ok,
-                "json": parsed,
-                "raw": raw,
-                "azure": True,
-            }
-            publish_json(self.pub, TOPIC_LLM_RESP, resp_payload)
-            self.logger.info("Published llm.response ok=%s", ok)
+            if cache_key is not None and cacheable and parsed["direction"] == "stop":
+                cache.put(cache_key, parsed, raw)
+
+        resp_payload = {
+            "ok": ok,
+            "json": parsed,
+            "raw": raw,
+            "azure": True,
+        }
+        publish_json(self.pub, TOPIC_LLM_RESP, resp_payload)
+        self.logger.info("Published llm.response ok=%s", ok)
 
 
 def main() -> None:
@@ -32,30 +32,46 @@ USAGE:
 from __future__ import annotations
 
 import json
+import math
+import re
 import time
+from itertools import islice
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum, auto
+from enum import IntEnum, auto
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
-class ConversationState(Enum):
+class ConversationState(IntEnum):
     """Conversation state machine."""
     IDLE = auto()           # No active conversation
     ACTIVE = auto()         # In conversation (waiting for user or responding)
     FOLLOW_UP = auto()      # Expecting follow-up (within timeout)
     
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Single conversation message."""
     role: str               # "user", "assistant", or "system"
     content: str
     timestamp: float = field(default_factory=time.time)
+    _rendered: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def rendered(self) -> str:
+        """Transcript line for prompt context, formatted once per message."""
+        if self._rendered is None:
+            prefix = "User" if self.role == "user" else "ROBO"
+            self._rendered = f"{prefix}: {self.content}"
+        return self._rendered
     
     def to_dict(self) -> Dict[str, str]:
         return {"role": self.role, "content": self.content}
@@ -64,7 +80,7 @@ class Message:
         return f"[{self.role}] {self.content}"
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotState:
     """Current state of the robot for context injection."""
     # Navigation
@@ -144,6 +160,13 @@ class ConversationMemory:
 ## CONVERSATION CONTEXT:
 {conversation_summary}'''
 
+    # The template split around its two placeholders with brace escapes
+    # resolved, so a prompt is one join instead of a format() parse.
+    _PROMPT_HEAD, _PROMPT_MID, _PROMPT_TAIL = (
+        part.replace("{{", "{").replace("}}", "}")
+        for part in re.split(r"\{robot_state\}|\{conversation_summary\}", SYSTEM_PROMPT_TEMPLATE)
+    )
+
     def __init__(
         self,
         max_turns: int = 10,
@@ -156,6 +179,8 @@ class ConversationMemory:
         
         # Message buffer (deque for efficient pop from front)
         self._messages: deque[Message] = deque(maxlen=max_turns * 2)
+        # Buffer length (80% of capacity) at which older turns are summarized
+        self._summarize_threshold = math.ceil(max_turns * 2 * 0.8)
         
         # Summary of older messages (when buffer overflows)
         self._summary: str = ""
@@ -199,23 +224,20 @@ class ConversationMemory:
     def _maybe_summarize(self) -> None:
         """Summarize older messages if buffer is getting large."""
         # Simple strategy: when at 80% capacity, summarize oldest 50%
-        if len(self._messages) >= self.max_turns * 2 * 0.8:
+        if len(self._messages) >= self._summarize_threshold:
             old_count = len(self._messages) // 2
-            old_messages = []
-            for _ in range(old_count):
-                if self._messages:
-                    old_messages.append(self._messages.popleft())
-            
-            if old_messages:
+            if old_count:
                 # Simple summarization (for a real system, use LLM)
-                summary_parts = []
-                for msg in old_messages:
-                    if msg.role == "user":
-                        summary_parts.append(f"User asked about: {msg.content[:50]}...")
-                    else:
-                        summary_parts.append(f"Assistant responded: {msg.content[:50]}...")
-                
-                new_summary = " ".join(summary_parts)
+                new_summary = " ".join(
+                    f"User asked about: {msg.content[:50]}..."
+                    if msg.role == "user"
+                    else f"Assistant responded: {msg.content[:50]}..."
+                    for msg in islice(self._messages, old_count)
+                )
+                self._messages = deque(
+                    islice(self._messages, old_count, None),
+                    maxlen=self._messages.maxlen,
+                )
                 if self._summary:
                     self._summary = f"{self._summary} {new_summary}"
                 else:
@@ -273,17 +295,12 @@ class ConversationMemory:
             conversation_parts.append(f"[Earlier context: {self._summary}]")
         
         # Add recent messages
-        for msg in self._messages:
-            prefix = "User" if msg.role == "user" else "ROBO"
-            conversation_parts.append(f"{prefix}: {msg.content}")
+        conversation_parts.extend([msg.rendered for msg in self._messages])
         
         conversation_summary = "\n".join(conversation_parts) if conversation_parts else "This is the start of the conversation."
         
         # Build full prompt
-        prompt = self.SYSTEM_PROMPT_TEMPLATE.format(
-            robot_state=self.robot_state.to_context_string(),
-            conversation_summary=conversation_summary,
-        )
+        prompt = self._render_system_prompt(conversation_summary)
         
         # Add current query if provided
         if current_query:
@@ -291,6 +308,16 @@ class ConversationMemory:
         
         return prompt
     
+    def _render_system_prompt(self, conversation_summary: str) -> str:
+        """Fill SYSTEM_PROMPT_TEMPLATE from its pre-split segments."""
+        return "".join((
+            self._PROMPT_HEAD,
+            self.robot_state.to_context_string(),
+            self._PROMPT_MID,
+            conversation_summary,
+            self._PROMPT_TAIL,
+        ))
+    
     def build_messages_format(self, current_query: str) -> List[Dict[str, str]]:
         """Build context in messages format (for chat APIs).
         
@@ -303,10 +330,7 @@ class ConversationMemory:
         messages = []
         
         # System message with robot state
-        system_content = self.SYSTEM_PROMPT_TEMPLATE.format(
-            robot_state=self.robot_state.to_context_string(),
-            conversation_summary="See message history below.",
-        )
+        system_content = self._render_system_prompt("See message history below.")
         messages.append({"role": "system", "content": system_content})
         
         # Historical messages
@@ -324,7 +348,7 @@ class ConversationMemory:
     
     def _is_expired(self) -> bool:
         """Check if conversation has timed out."""
-        if self._state == ConversationState.IDLE:
+        if self._state is ConversationState.IDLE:
             return False
         elapsed = time.time() - self._last_interaction_ts
         return elapsed > self.conversation_timeout_s
@@ -341,7 +365,7 @@ class ConversationMemory:
         This helps the orchestrator decide whether to be more
         responsive to speech (lower thresholds, shorter timeout).
         """
-        if self._state != ConversationState.FOLLOW_UP:
+        if self._state is not ConversationState.FOLLOW_UP:
             return False
         return not self._is_expired()
     
@@ -370,14 +394,18 @@ class ConversationMemory:
             "last_interaction_ts": self._last_interaction_ts,
         }
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2))
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            path.write_text(json.dumps(data, indent=2))
     
     def load_from_file(self, path: Path) -> bool:
         """Load conversation state from JSON file."""
         if not path.exists():
             return False
         try:
-            data = json.loads(path.read_text())
+            raw = path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             self._messages.clear()
             for m in data.get("messages", []):
                 self._messages.append(Message(
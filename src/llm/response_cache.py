@@ -0,0 +1,117 @@
+"""Short-lived cache for informational LLM replies.
+
+Repeated questions ("what do you see?") are answered from memory instead of
+another cloud round trip, as long as nothing the prompt depends on changed:
+
+- The key holds the normalised question, the robot direction and a coarse
+  scene summary (see ``scene_key``): the vision label, the obstacle/safety
+  flags, a bucketed distance and the motion and vision modes. Per-frame
+  noise such as timestamps, request ids and raw sensor readings is left
+  out, so the same scene a few seconds later still hits.
+- Requests that move or steer the robot are never cached (see
+  ``COMMAND_RE``); callers should also only store replies that keep the
+  robot stopped.
+- Entries expire after ``ttl_s``; the least recently used is evicted beyond
+  ``max_entries``.
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Requests that move or steer the robot are never answered from the cache.
+COMMAND_RE = re.compile(
+    r"\b(go|move|drive|turn|rotate|stop|track|follow|come|scan|forward|backward|left|right)\b",
+    re.IGNORECASE,
+)
+
+
+# Distances are compared in buckets of this many cm; finer changes are noise.
+_DISTANCE_BUCKET_CM = 20
+
+
+def _last_known(world_context: Dict[str, Any], section: str) -> tuple[Dict[str, Any], bool]:
+    entry = world_context.get(section)
+    if not isinstance(entry, dict):
+        return {}, True
+    value = entry.get("last_known")
+    return (value if isinstance(value, dict) else {}), bool(entry.get("stale"))
+
+
+def scene_key(world_context: Any) -> Optional[tuple[Any, ...]]:
+    """Summarise a world-context snapshot into the inputs a reply depends on."""
+    if not isinstance(world_context, dict):
+        return None
+    vision, vision_stale = _last_known(world_context, "vision")
+    sensors, sensors_stale = _last_known(world_context, "sensors")
+    robot, _ = _last_known(world_context, "robot_state")
+    data = sensors.get("data") if isinstance(sensors.get("data"), dict) else {}
+    min_distance = data.get("min_distance")
+    bucket = (
+        int(min_distance) // _DISTANCE_BUCKET_CM
+        if isinstance(min_distance, (int, float)) and min_distance >= 0
+        else None
+    )
+    return (
+        vision.get("label"),
+        vision_stale,
+        bool(data.get("obstacle")),
+        bool(data.get("warning")),
+        data.get("is_safe"),
+        bucket,
+        sensors.get("alert"),
+        sensors.get("blocked"),
+        sensors_stale,
+        robot.get("motion"),
+        robot.get("vision_mode"),
+    )
+
+
+class ResponseCache:
+    """TTL + LRU cache of ``(parsed, raw)`` LLM replies."""
+
+    def __init__(
+        self,
+        ttl_s: float = 30.0,
+        max_entries: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._clock = clock
+        # key -> (expires_at, parsed, raw)
+        self._entries: "OrderedDict[tuple[Any, ...], tuple[float, Dict[str, Any], str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, text: str, payload: Dict[str, Any]) -> Optional[tuple[Any, ...]]:
+        """Cache key for a request, or None when it must not be cached."""
+        if self.ttl_s <= 0 or COMMAND_RE.search(text):
+            return None
+        vision = payload.get("vision")
+        label = vision.get("label") if isinstance(vision, dict) else None
+        scene = scene_key(payload.get("world_context"))
+        return (" ".join(text.lower().split()), payload.get("direction"), label, scene)
+
+    def get(self, key: tuple[Any, ...]) -> Optional[tuple[Dict[str, Any], str]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        _, parsed, raw = entry
+        return dict(parsed), raw
+
+    def put(self, key: tuple[Any, ...], parsed: Dict[str, Any], raw: str) -> None:
+        self._entries[key] = (self._clock() + self.ttl_s, dict(parsed), raw)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
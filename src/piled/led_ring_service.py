@@ -300,23 +300,37 @@ class LedRingService:
             self.animator.set_state("idle")
 
     def _drain(self) -> None:
-        """Process all pending messages."""
+        """Process all pending messages.
+
+        Display state is latest-wins: only the newest queued frame is decoded
+        and applied, so a backlog never replays stale animations.
+        """
+        latest_state = None
         while True:
             try:
                 topic, data = self.sub.recv_multipart(flags=zmq.NOBLOCK)
             except zmq.Again:
                 break
+            if topic == TOPIC_DISPLAY_STATE:
+                latest_state = data
+                continue
             try:
                 payload = json.loads(data)
             except json.JSONDecodeError:
                 self.logger.error("Invalid JSON on topic %s", topic)
                 continue
             
-            if topic == TOPIC_DISPLAY_STATE:
-                self._handle_display_state(payload)
-            elif topic == TOPIC_HEALTH:
+            if topic == TOPIC_HEALTH:
                 self._handle_health(payload)
 
+        if latest_state is not None:
+            try:
+                payload = json.loads(latest_state)
+            except json.JSONDecodeError:
+                self.logger.error("Invalid JSON on topic %s", TOPIC_DISPLAY_STATE)
+                return
+            self._handle_display_state(payload)
+
     def run(self) -> None:
         """Main loop: poll for state updates, render animations."""
         self.logger.info("LED ring service running (phase-driven mode)")
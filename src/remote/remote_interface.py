@@ -35,6 +35,7 @@ from src.core.ipc import (
     TOPIC_VISN,
     TOPIC_VISN_CAPTURED,
     TOPIC_VISN_FRAME,
+    loads_json,
     make_publisher,
     make_subscriber,
     publish_json,
@@ -142,12 +143,15 @@ class RemoteSupervisor:
         self._pub = make_publisher(self.config, channel="upstream")
         self._sub_up = make_subscriber(self.config, channel="upstream")
         self._sub_down = make_subscriber(self.config, channel="downstream")
+        # Camera frames arrive via the orchestrator's frame proxy, not the event bus.
+        self._sub_frames = make_subscriber(
+            self.config, topic=TOPIC_VISN_FRAME, channel="frames_downstream"
+        )
 
         # Subscribe to key telemetry topics
         for topic in [
             TOPIC_ESP,
             TOPIC_VISN,
-            TOPIC_VISN_FRAME,
             TOPIC_VISN_CAPTURED,
             TOPIC_HEALTH,
             TOPIC_LLM_RESP,
@@ -162,7 +166,6 @@ class RemoteSupervisor:
             TOPIC_CMD_VISION_MODE,
             TOPIC_CMD_PAUSE_VISION,
             TOPIC_VISN,
-            TOPIC_VISN_FRAME,
             TOPIC_VISN_CAPTURED,
             TOPIC_TTS,
         ]:
@@ -171,11 +174,13 @@ class RemoteSupervisor:
         self._poller = zmq.Poller()
         self._poller.register(self._sub_up, zmq.POLLIN)
         self._poller.register(self._sub_down, zmq.POLLIN)
+        self._poller.register(self._sub_frames, zmq.POLLIN)
 
         self._running = True
         self._last_session_emit = False
         self._stream_lock = threading.Condition()
-        self._latest_frame: Optional[bytes] = None
+        # View onto the newest libzmq frame buffer; never copied into bytes.
+        self._latest_frame: Optional[memoryview] = None
         self._latest_frame_ts: float = 0.0
         self._log_services = {
             "remote_interface": ["remote.interface.log", "remote-interface.log"],
@@ -298,6 +303,22 @@ class RemoteSupervisor:
                 self._drain_socket(self._sub_up)
             if self._sub_down in events:
                 self._drain_socket(self._sub_down)
+            if self._sub_frames in events:
+                self._drain_frames(self._sub_frames)
+
+    def _drain_frames(self, sock: zmq.Socket) -> None:
+        latest = None
+        while True:
+            try:
+                _topic, latest = sock.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                break
+        if latest is None:
+            return
+        with self._stream_lock:
+            self._latest_frame = latest.buffer
+            self._latest_frame_ts = time.time()
+            self._stream_lock.notify_all()
 
     def _drain_socket(self, sock: zmq.Socket) -> None:
         while True:
@@ -305,16 +326,10 @@ class RemoteSupervisor:
                 topic, raw = sock.recv_multipart(flags=zmq.NOBLOCK)
             except zmq.Again:
                 break
-            if topic == TOPIC_VISN_FRAME:
-                with self._stream_lock:
-                    self._latest_frame = raw
-                    self._latest_frame_ts = time.time()
-                    self._stream_lock.notify_all()
-                continue
 
             try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
+                payload = loads_json(raw)
+            except ValueError:
                 continue
 
             with self.telemetry.lock:
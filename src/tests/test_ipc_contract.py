@@ -1,6 +1,13 @@
-from src.core.ipc import TOPIC_WW_DETECTED, TOPIC_STT
+from src.core.ipc import TOPIC_WW_DETECTED, TOPIC_STT, dumps_json, loads_json
 
 
 def test_topic_constants():
     assert TOPIC_WW_DETECTED == b"ww.detected"
     assert TOPIC_STT == b"stt.transcription"
+
+
+def test_json_helpers_roundtrip():
+    payload = {"text": "héllo", "confidence": 0.5, "nested": {"ok": True}}
+    data = dumps_json(payload)
+    assert isinstance(data, bytes)
+    assert loads_json(data) == payload
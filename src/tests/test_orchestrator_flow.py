@@ -39,8 +39,12 @@ def test_orchestrator_sequence():
     # Use isolated ports
     upstream = "tcp://127.0.0.1:6210"
     downstream = "tcp://127.0.0.1:6211"
+    frames_upstream = "tcp://127.0.0.1:6212"
+    frames_downstream = "tcp://127.0.0.1:6213"
     os.environ["IPC_UPSTREAM"] = upstream
     os.environ["IPC_DOWNSTREAM"] = downstream
+    os.environ["IPC_FRAMES_UPSTREAM"] = frames_upstream
+    os.environ["IPC_FRAMES_DOWNSTREAM"] = frames_downstream
     os.environ["STT_ENGINE_DISABLED"] = "1"
 
     ctx = zmq.Context.instance()
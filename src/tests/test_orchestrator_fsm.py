@@ -0,0 +1,17 @@
+"""Unit checks for the orchestrator's transition jump table."""
+from __future__ import annotations
+
+from src.core.orchestrator import Event, Orchestrator, Phase
+
+
+def test_jump_table_matches_transitions():
+    for (phase, event), next_phase in Orchestrator.TRANSITIONS.items():
+        assert Orchestrator._TRANS[phase][event] is next_phase
+
+
+def test_jump_table_rejects_undeclared_edges():
+    declared = set(Orchestrator.TRANSITIONS)
+    for phase in Phase:
+        for event in Event:
+            if (phase, event) not in declared:
+                assert Orchestrator._TRANS[phase][event] is None
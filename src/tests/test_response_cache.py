@@ -0,0 +1,144 @@
+"""Unit checks for the informational LLM reply cache."""
+from __future__ import annotations
+
+import time
+
+from src.core.ipc import TOPIC_ESP, TOPIC_NAV, TOPIC_VISN
+from src.core.world_context import WorldContextAggregator
+from src.llm.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _aggregator() -> WorldContextAggregator:
+    # Never started: payloads are applied through its topic handlers directly.
+    return WorldContextAggregator({})
+
+
+def _feed(agg: WorldContextAggregator, topic: bytes, payload: dict) -> None:
+    agg._state = agg._handlers[topic](agg._state, payload, time.monotonic())
+
+
+def _vision(ts: float, request_id: str) -> dict:
+    # Shape published by vision_runner.publish_detections.
+    return {"label": "cup", "bbox": [10, 20, 110, 220], "confidence": 0.87, "ts": ts, "request_id": request_id}
+
+
+def _esp(ts: float, s1: int, min_distance: int, obstacle: bool = False) -> dict:
+    # Shape published by motor_bridge for a DATA line.
+    data = {
+        "s1": s1, "s2": s1 + 7, "s3": s1 + 3, "mq2": 212 + s1 % 5,
+        "lmotor": 0, "rmotor": 0, "min_distance": min_distance,
+        "obstacle": obstacle, "warning": False, "is_safe": not obstacle,
+    }
+    return {"data": data, "data_ts": ts, "buffer": [dict(data, ts=ts)]}
+
+
+def _request(text: str, **extra) -> dict:
+    payload = {"text": text, "direction": "stopped", "vision": {"label": "cup"}}
+    payload.update(extra)
+    return payload
+
+
+def test_repeat_question_hits_after_put() -> None:
+    cache = ResponseCache(ttl_s=30.0, clock=FakeClock())
+    key = cache.key_for("What do you see", _request("What do you see"))
+    assert cache.get(key) is None
+    cache.put(key, {"speak": "A cup", "direction": "stop"}, "raw")
+
+    again = cache.key_for("  what do you SEE ", _request("  what do you SEE "))
+    assert again == key
+    parsed, raw = cache.get(again)
+    assert parsed == {"speak": "A cup", "direction": "stop"}
+    assert raw == "raw"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_hit_returns_a_copy() -> None:
+    cache = ResponseCache(clock=FakeClock())
+    key = cache.key_for("hello", _request("hello"))
+    cache.put(key, {"speak": "hi"}, "hi")
+    cache.get(key)[0]["speak"] = "mutated"
+    assert cache.get(key)[0]["speak"] == "hi"
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(ttl_s=30.0, clock=clock)
+    key = cache.key_for("hello", _request("hello"))
+    cache.put(key, {"speak": "hi"}, "hi")
+    clock.now = 29.0
+    assert cache.get(key) is not None
+    clock.now = 31.0
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = ResponseCache(max_entries=2, clock=FakeClock())
+    keys = [cache.key_for(text, _request(text)) for text in ("one", "two", "three")]
+    cache.put(keys[0], {}, "1")
+    cache.put(keys[1], {}, "2")
+    assert cache.get(keys[0]) is not None  # "one" is now the most recent
+    cache.put(keys[2], {}, "3")
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_commands_are_never_cached() -> None:
+    cache = ResponseCache()
+    for text in ("turn left please", "Move forward", "follow that person", "stop"):
+        assert cache.key_for(text, _request(text)) is None
+
+
+def test_zero_ttl_disables_the_cache() -> None:
+    cache = ResponseCache(ttl_s=0)
+    assert cache.key_for("hello", _request("hello")) is None
+
+
+def test_same_scene_seconds_apart_hits() -> None:
+    agg = _aggregator()
+    cache = ResponseCache(clock=FakeClock())
+    text = "what do you see"
+
+    _feed(agg, TOPIC_ESP, _esp(1000.0, s1=83, min_distance=83))
+    _feed(agg, TOPIC_NAV, {"direction": "stop"})
+    _feed(agg, TOPIC_VISN, _vision(1000.2, "visn-1000-1"))
+    first = cache.key_for(text, _request(text, world_context=agg.get_snapshot()))
+    cache.put(first, {"speak": "A cup", "direction": "stop"}, "raw")
+
+    # A new capture and fresh sensor frames a few seconds later, same scene.
+    _feed(agg, TOPIC_ESP, _esp(1004.0, s1=85, min_distance=85))
+    _feed(agg, TOPIC_VISN, _vision(1004.1, "visn-1004-2"))
+    second = cache.key_for(text, _request(text, world_context=agg.get_snapshot()))
+    assert second == first
+    assert cache.get(second) is not None
+
+
+def test_scene_changes_miss() -> None:
+    agg = _aggregator()
+    text = "is the path clear"
+    _feed(agg, TOPIC_ESP, _esp(1000.0, s1=83, min_distance=83))
+    clear = ResponseCache().key_for(text, _request(text, world_context=agg.get_snapshot()))
+
+    _feed(agg, TOPIC_ESP, _esp(1002.0, s1=12, min_distance=12, obstacle=True))
+    blocked = ResponseCache().key_for(text, _request(text, world_context=agg.get_snapshot()))
+    assert blocked != clear
+
+    _feed(agg, TOPIC_ESP, _esp(1004.0, s1=30, min_distance=30))
+    closer = ResponseCache().key_for(text, _request(text, world_context=agg.get_snapshot()))
+    assert closer not in (clear, blocked)
+
+
+def test_key_tracks_direction_and_vision_label() -> None:
+    cache = ResponseCache()
+    base = cache.key_for("hello", _request("hello"))
+    assert cache.key_for("hello", _request("hello", direction="forward")) != base
+    assert cache.key_for("hello", _request("hello", vision={"label": "dog"})) != base
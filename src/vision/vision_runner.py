@@ -303,6 +303,7 @@ def run():
         return
 
     pub = make_publisher(cfg, channel="upstream")
+    frame_pub = make_publisher(cfg, channel="frames_upstream")
     ctrl_sub = make_subscriber(cfg, topic=TOPIC_CMD_PAUSE_VISION, channel="downstream")
     ctrl_sub.setsockopt(zmq.SUBSCRIBE, TOPIC_CMD_VISN_CAPTURE)
     ctrl_sub.setsockopt(zmq.SUBSCRIBE, TOPIC_CMD_VISION_MODE)
@@ -373,7 +374,7 @@ def run():
         success, encoded = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
         if not success:
             return
-        pub.send_multipart([TOPIC_VISN_FRAME, encoded.tobytes()])
+        frame_pub.send_multipart([TOPIC_VISN_FRAME, encoded.tobytes()])
         last_stream_time = now
 
     def _save_capture_async(frame: np.ndarray, request_id: Optional[str]) -> None: